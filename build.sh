@@ -3,4 +3,5 @@ ls
 pip install -r requirments.txt
 python manage.py makemigrations
 python manage.py collectstatic --no-input
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+python manage.py bake_reference
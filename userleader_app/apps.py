@@ -1,5 +1,11 @@
+import logging
+import os
+import sys
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class UserleaderAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
@@ -7,3 +13,30 @@ class UserleaderAppConfig(AppConfig):
 
     def ready(self):
         import userleader_app.signals
+        from .integrateModel import DEFAULT_MODEL_PATH, load_model_artifacts
+
+        # runserver's autoreloader runs ready() in the watcher process too;
+        # only the reloaded child (RUN_MAIN=true) serves requests, so skip
+        # the warm-up there. Production servers don't set RUN_MAIN and are
+        # unaffected.
+        if 'runserver' in sys.argv and os.environ.get('RUN_MAIN') != 'true':
+            return
+
+        # Warm the model cache at startup so no request pays the
+        # RandomForest unpickling cost. The model file is fetched
+        # separately (download_model.py), so its absence is tolerated
+        # here and surfaces on first prediction instead.
+        try:
+            # Pass the path explicitly so this warms the same lru_cache
+            # entry the request path looks up.
+            load_model_artifacts(DEFAULT_MODEL_PATH)
+        except FileNotFoundError as e:
+            logger.warning(f"Model artifacts not preloaded: {e}")
+
+        # Warm the reference table the same way (pickle sidecar or Excel
+        # parse), so the first upload doesn't pay the cold load either.
+        from .views import REFERENCE_PATH, _load_reference
+        try:
+            _load_reference(REFERENCE_PATH, REFERENCE_PATH.stat().st_mtime)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Reference data not preloaded: {e}")
@@ -0,0 +1,34 @@
+from django.core.cache import cache
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+# How long a token->user resolution may be served from cache. Short enough
+# that deactivations/permission changes propagate quickly, long enough to
+# absorb the per-request DB lookup under bursty traffic.
+USER_CACHE_TTL = 60
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that caches the user record resolved from a
+    validated token.
+
+    Every authenticated request otherwise costs one user-table query even
+    though the token already proves identity. Users are cached for
+    USER_CACHE_TTL seconds keyed by the token's user id; with the default
+    locmem backend the cache is per-process, and a shared backend (e.g.
+    Redis) extends it across workers.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        cache_key = f'jwt_user:{user_id}'
+        user = cache.get(cache_key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(cache_key, user, USER_CACHE_TTL)
+        return user
@@ -1,7 +1,7 @@
 import csv
 import numpy as np
+import pandas as pd
 import math
-import re
 
 # Define keywords for transmittance and absorbance headers
 keywords = ['transmittance', 'Transmittance', 'TRANSMITTANCE', 't', 'T',
@@ -13,47 +13,33 @@ x_header = ['cm-1', 'wavenumber', 'Wavenumber', '1/cm', 'cm^-1', 'micrometers',
             'wavenumber (m-1)', 'wavenumber (m^-1)', 'Wavenumber (m-1)', 'Wavenumber (m^-1)', 'wavenumber (1/cm)',
             'Wavenumber (1/cm)', 'wavenumber (cm-1)', 'wavenumber (cm^-1)', 'Wavenumber (cm-1)', 'Wavenumber (cm^-1)']
 
-def extract_x(data, row_number, x_index):
-    x = []
-    for row in data[row_number:]:
-        if len(row) > x_index:
-            value = row[x_index].strip()
-            if value:
-                # Remove any unwanted characters except digits, decimal points, minus signs, and spaces
-                cleaned_str = re.sub(r'[^\d\.\-\s±]', '', value)
-                try:
-                    # Handle '±' symbol
-                    if '±' in cleaned_str:
-                        base_value = cleaned_str.split('±')[0].strip()
-                    else:
-                        base_value = cleaned_str
-                    x.append(float(base_value))
-                except ValueError:
-                    # Skip invalid values
-                    continue
-        else:
-            continue  # Skip rows with missing x values
-    if not x:
+def extract_x(data: list, row_number: int, x_index: int) -> dict:
+    # Gather the raw column, then clean and convert it in vectorized pandas
+    # string/numeric ops instead of a per-cell regex + float() loop.
+    raw = pd.Series(
+        [row[x_index] for row in data[row_number:] if len(row) > x_index],
+        dtype=object
+    )
+    # Remove any unwanted characters except digits, decimal points, minus
+    # signs, and spaces; keep only the base value of '±' forms.
+    cleaned = raw.str.replace(r'[^\d\.\-\s±]', '', regex=True)
+    cleaned = cleaned.str.split('±').str[0].str.strip()
+    # Invalid or empty cells coerce to NaN and are skipped
+    x_array = pd.to_numeric(cleaned, errors='coerce').dropna().to_numpy()
+    if x_array.size == 0:
         raise ValueError("No valid wavenumber data found.")
-    x_array = np.array(x)
     return {'wavenumber': x_array.tolist(), 'wavelengths': (1e4 / x_array).tolist()}
 
-def extract_y(data, row_number, y_index):
-    y = []
-    for row in data[row_number:]:
-        if len(row) > y_index:
-            value = row[y_index].strip()
-            if value:
-                try:
-                    y.append(float(value))
-                except ValueError:
-                    # Skip invalid values
-                    continue
-        else:
-            continue  # Skip rows with missing y values
-    if not y:
+def extract_y(data: list, row_number: int, y_index: int) -> dict:
+    # Same batched conversion as extract_x: one pandas to_numeric pass
+    # replaces per-cell strip/float calls; invalid or empty cells drop out.
+    raw = pd.Series(
+        [row[y_index] for row in data[row_number:] if len(row) > y_index],
+        dtype=object
+    )
+    y_numeric = pd.to_numeric(raw.str.strip(), errors='coerce').dropna().to_numpy()
+    if y_numeric.size == 0:
         raise ValueError("No valid transmittance or absorbance data found.")
-    y_numeric = np.array(y)
 
     header_value = data[row_number - 1][y_index]
     if header_value in ('transmittance', 'Transmittance', 'TRANSMITTANCE', 't', 'T'):
@@ -69,10 +55,56 @@ def extract_y(data, row_number, y_index):
     else:
         return {}
 
+# Lowercased header aliases shared with csv_read's sniffing logic.
+_X_ALIASES = frozenset(h.lower() for h in x_header)
+_ABSORBANCE_ALIASES = frozenset({'absorbance', 'a'})
+_TRANSMITTANCE_ALIASES = frozenset({'transmittance', 't'})
+
+def csv_read_fast(uploaded_file) -> dict:
+    """
+    Parse a well-formed spectrum CSV straight from the upload with pandas'
+    C engine (streaming, no intermediate str of the whole file).
+
+    Returns a dict shaped like csv_read's output, or None when the file
+    does not look like a plain headered CSV — callers then fall back to
+    the tolerant csv_read path.
+    """
+    try:
+        df = pd.read_csv(uploaded_file, engine='c', skipinitialspace=True)
+    except Exception:
+        return None
+
+    columns = {str(col).strip().lower(): col for col in df.columns}
+    x_col = next((columns[name] for name in columns if name in _X_ALIASES), None)
+    a_col = next((columns[name] for name in columns if name in _ABSORBANCE_ALIASES), None)
+    t_col = next((columns[name] for name in columns if name in _TRANSMITTANCE_ALIASES), None)
+    if x_col is None or (a_col is None and t_col is None):
+        return None
+
+    try:
+        file_data = {'wavenumber': df[x_col].to_numpy(dtype=np.float64)}
+        # Mirror csv_read's precedence: a transmittance column wins when
+        # both are present, and is treated as a 0-1 fraction.
+        if t_col is not None:
+            file_data['transmittance'] = np.clip(
+                df[t_col].to_numpy(dtype=np.float64), 0.0, 1.0
+            )
+        else:
+            file_data['absorbance'] = df[a_col].to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    return file_data
+
 # Modify the header matching to be case-insensitive
-def csv_read(file_content):
+def csv_read(file_content) -> dict:
     file_data = {}
-    data = list(csv.reader(file_content.splitlines()))
+    # Accept either the whole file as a str or any iterable of text lines
+    # (e.g. an io.TextIOWrapper streaming an upload), so callers can avoid
+    # materializing a second full copy of the file just to split it.
+    if isinstance(file_content, str):
+        file_content = file_content.splitlines()
+    data = list(csv.reader(file_content))
     found_x = False
     found_y = False
 
@@ -1,78 +1,82 @@
-import os
+import functools
 import joblib
-import pandas as pd
 import numpy as np
 import logging
 import traceback
+from pathlib import Path
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-def predict_most_frequent_name(wavenumbers, transmittance, model_path=None):
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    models_dir = os.path.join(current_dir, 'models')
+_MODELS_DIR = Path(__file__).resolve().parent / 'models'
+DEFAULT_MODEL_PATH = _MODELS_DIR / 'best_rf_model.pkl'
+SCALER_PATH = _MODELS_DIR / 'scaler.pkl'
+LABEL_ENCODER_PATH = _MODELS_DIR / 'label_encoder.pkl'
+
+@functools.lru_cache(maxsize=2)
+def load_model_artifacts(model_path=DEFAULT_MODEL_PATH):
+    """
+    Load and cache the RF model, scaler, and label encoder.
+
+    Unpickling the RandomForest dominates prediction time, so the
+    artifacts are loaded once per process (warmed from AppConfig.ready)
+    and reused by every request; joblib mmaps the forest's arrays to keep
+    resident memory down.
+
+    Returns:
+        tuple: (model, scaler, label_encoder).
+
+    Raises:
+        FileNotFoundError: If any of the artifact files is missing.
+    """
+    for path, label in ((Path(model_path), 'Model'),
+                        (SCALER_PATH, 'Scaler'),
+                        (LABEL_ENCODER_PATH, 'Label encoder')):
+        if not path.exists():
+            logger.error(f"{label} file not found: {path}")
+            raise FileNotFoundError(f"{label} file not found: {path}")
+
+    logger.info("Loading model, scaler, and label encoder.")
+    model = joblib.load(model_path, mmap_mode='r')
+    scaler = joblib.load(SCALER_PATH)
+    label_encoder = joblib.load(LABEL_ENCODER_PATH)
+    return model, scaler, label_encoder
 
-    # Set default paths if none provided
+def predict_most_frequent_name(wavenumbers, transmittance, model_path=None):
     if model_path is None:
-        model_path = os.path.join(models_dir, 'best_rf_model.pkl')
-    scaler_path = os.path.join(models_dir, 'scaler.pkl')
-    label_encoder_path = os.path.join(models_dir, 'label_encoder.pkl')
+        model_path = DEFAULT_MODEL_PATH
 
     try:
-        # Check for model files
-        if not os.path.exists(model_path):
-            logger.error(f"Model file not found: {model_path}")
-            raise FileNotFoundError(f"Model file not found: {model_path}")
-        if not os.path.exists(scaler_path):
-            logger.error(f"Scaler file not found: {scaler_path}")
-            raise FileNotFoundError(f"Scaler file not found: {scaler_path}")
-        if not os.path.exists(label_encoder_path):
-            logger.error(f"Label encoder file not found: {label_encoder_path}")
-            raise FileNotFoundError(f"Label encoder file not found: {label_encoder_path}")
-
-        # Load the model, scaler, and label encoder
-        logger.info("Loading model, scaler, and label encoder.")
-        model = joblib.load(model_path)
-        scaler = joblib.load(scaler_path)
-        label_encoder = joblib.load(label_encoder_path)
-
-        # Create a DataFrame from the provided wavenumbers and transmittance
-        data_csv = pd.DataFrame({
-            'wavenumbers': wavenumbers,
-            'transmittance': transmittance
-        })
+        model, scaler, label_encoder = load_model_artifacts(model_path)
+
+        # Build the (samples, 2) feature matrix directly — the scaler and
+        # forest both consume plain ndarrays, so the DataFrame round-trips
+        # (construct, astype, rename, column-select) were pure overhead.
+        X_new = np.column_stack((
+            np.asarray(wavenumbers, dtype=np.float64),
+            np.asarray(transmittance, dtype=np.float64)
+        ))
 
         # Validate data
-        if not np.isfinite(data_csv.values).all():
+        if not np.isfinite(X_new).all():
             logger.error("Input data contains NaN or infinite values.")
             raise ValueError("Input data contains NaN or infinite values.")
 
-        # Ensure data types are correct
-        data_csv = data_csv.astype(float)
-
         # Scale the data
         logger.info("Scaling data.")
-        data_scaled_array = scaler.transform(data_csv[['wavenumbers', 'transmittance']])
-        data_scaled = pd.DataFrame(data_scaled_array, columns=['wavenumbers', 'transmittance'])
-
-        # Rename columns to match the model's expected feature names
-        data_scaled.rename(columns={
-            'wavenumbers': 'Wavenumber',
-            'transmittance': 'Transmittance'
-        }, inplace=True)
-
-        # Prepare data for prediction
-        X_new_model = data_scaled[['Wavenumber', 'Transmittance']]
+        X_new_scaled = scaler.transform(X_new)
 
         # Make predictions
         logger.info("Making predictions.")
-        y_new_pred = model.predict(X_new_model)
+        y_new_pred = model.predict(X_new_scaled)
 
         # Use the loaded label encoder to inverse transform the predictions
         predicted_names = label_encoder.inverse_transform(y_new_pred)
 
-        # Determine the most frequently predicted name
-        most_frequent_name = pd.Series(predicted_names).mode()[0]
+        # Determine the most frequently predicted name (ties resolve to the
+        # lexicographically smallest label, matching Series.mode()[0]).
+        values, counts = np.unique(predicted_names, return_counts=True)
+        most_frequent_name = values[np.argmax(counts)]
 
         return most_frequent_name
 
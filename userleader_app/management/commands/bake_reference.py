@@ -0,0 +1,32 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from userleader_app.peak_detection import bake_reference_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-parse the IR reference Excel table and write its binary sidecar "
+        "cache so the first request does not pay the openpyxl parsing cost."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reference-path',
+            default=None,
+            help="Path to the reference Excel file (defaults to the bundled "
+                 "IR correlation table)."
+        )
+
+    def handle(self, *args, **options):
+        reference_path = options['reference_path']
+        if reference_path is None:
+            app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            reference_path = os.path.join(app_dir, 'data', 'IR_Correlation_Table_5000_to_250.xlsx')
+
+        if not os.path.exists(reference_path):
+            raise CommandError(f"Reference file not found at: {reference_path}")
+
+        cache_path = bake_reference_cache(reference_path)
+        self.stdout.write(self.style.SUCCESS(f"Reference cache written to {cache_path}"))
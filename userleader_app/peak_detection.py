@@ -1,3 +1,5 @@
+import os
+import re
 import numpy as np
 import pandas as pd
 from scipy.signal import find_peaks, savgol_filter
@@ -7,10 +9,45 @@ import matplotlib.pyplot as plt
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-def process_reference_data(reference_path, tolerance=0.05):
+# Default tolerance baked into the on-disk reference cache.
+DEFAULT_TOLERANCE = 0.05
+
+# Matches '3200', '3200-3550', or '3450±50' (optionally suffixed 'cm-1',
+# stripped before matching) in the reference table's wavenumber column.
+_WAVENUMBER_PATTERN = re.compile(
+    r'^\s*(?P<a>\d+(?:\.\d+)?)\s*(?:(?P<sep>[-±])\s*(?P<b>\d+(?:\.\d+)?))?\s*$'
+)
+
+def _reference_cache_path(reference_path: str) -> str:
+    """Return the path of the binary sidecar cache for a reference file."""
+    return str(reference_path) + '.ref.pkl'
+
+def bake_reference_cache(reference_path: str, tolerance: float = DEFAULT_TOLERANCE) -> str:
+    """
+    Parse the reference Excel file and persist the processed DataFrame as a
+    pickle sidecar so later loads skip openpyxl entirely.
+
+    Args:
+        reference_path (str): Path to the reference Excel file.
+        tolerance (float): Tolerance percentage for matching wavenumbers.
+
+    Returns:
+        str: Path of the written cache file.
+    """
+    processed = _parse_reference_excel(reference_path, tolerance)
+    cache_path = _reference_cache_path(reference_path)
+    processed.to_pickle(cache_path)
+    return cache_path
+
+def process_reference_data(reference_path: str, tolerance: float = DEFAULT_TOLERANCE) -> pd.DataFrame:
     """
     Processes the reference data from the given Excel file.
 
+    A pickle sidecar (written by `bake_reference_cache` or a previous call)
+    is preferred when it is newer than the Excel file, since openpyxl
+    parsing dominates cold-load time; the Excel file remains the source of
+    truth and is re-parsed whenever it changes.
+
     Args:
         reference_path (str): Path to the reference Excel file.
         tolerance (float): Tolerance percentage for matching wavenumbers.
@@ -22,9 +59,54 @@ def process_reference_data(reference_path, tolerance=0.05):
         FileNotFoundError: If the reference file is not found.
         ValueError: If required columns are missing or data cannot be processed.
     """
+    cache_path = _reference_cache_path(reference_path)
+    if tolerance == DEFAULT_TOLERANCE and os.path.exists(cache_path):
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(reference_path):
+                processed = pd.read_pickle(cache_path)
+                # Sidecars written before the attrs became tuples carry
+                # ndarrays, which break pandas' attrs propagation.
+                for key in ('sort_order', 'centers_sorted'):
+                    value = processed.attrs.get(key)
+                    if isinstance(value, np.ndarray):
+                        processed.attrs[key] = tuple(value.tolist())
+                return processed
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable reference cache {cache_path}: {e}")
+
+    processed = _parse_reference_excel(reference_path, tolerance)
+
+    if tolerance == DEFAULT_TOLERANCE:
+        try:
+            processed.to_pickle(cache_path)
+        except OSError as e:
+            logger.warning(f"Unable to write reference cache {cache_path}: {e}")
+
+    return processed
+
+def _read_reference_sheet(reference_path: str) -> pd.DataFrame:
+    """
+    Read the reference workbook's first sheet with openpyxl in read-only
+    mode, which streams rows and skips the style/dimension bookkeeping that
+    dominates a regular pd.read_excel cold load.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(reference_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError(f"Reference file is empty: {reference_path}")
+        return pd.DataFrame(rows, columns=list(header))
+    finally:
+        workbook.close()
+
+def _parse_reference_excel(reference_path: str, tolerance: float) -> pd.DataFrame:
+    """Parse the reference Excel file into the processed bounds DataFrame."""
     # Read the reference Excel file
     try:
-        reference = pd.read_excel(reference_path)
+        reference = _read_reference_sheet(reference_path)
     except FileNotFoundError:
         logger.error(f"Reference file not found at: {reference_path}")
         raise FileNotFoundError(f"Reference file not found at: {reference_path}")
@@ -39,60 +121,66 @@ def process_reference_data(reference_path, tolerance=0.05):
         logger.error(f"Reference data must contain the following columns: {', '.join(missing_columns)}")
         raise ValueError(f"Reference data must contain the following columns: {', '.join(missing_columns)}")
     
-    # Initialize lists to store processed data
-    centers = []
-    lower_bounds = []
-    upper_bounds = []
-    bond_types = []
-    functional_groups = []
-    compounds = []
-
-    for index, row in reference.iterrows():
-        wavenumber_value = row['Wavenumbers (cm-1)']
-        bond_type = row['Bond Type']
-        functional_group = row['Functional Group']
-        compound = row['Compound']
-
-        wavenumber_str = str(wavenumber_value).replace('cm-1', '').strip()
-        try:
-            if '-' in wavenumber_str:
-                low_str, high_str = wavenumber_str.split('-')
-                low = float(low_str.strip())
-                high = float(high_str.strip())
-                center = (low + high) / 2
-            elif '±' in wavenumber_str:
-                base_value, uncertainty = wavenumber_str.split('±')
-                center = float(base_value.strip())
-                uncertainty = float(uncertainty.strip())
-                low = center - uncertainty
-                high = center + uncertainty
-            else:
-                center = float(wavenumber_str.strip())
-                low = center * (1 - tolerance)
-                high = center * (1 + tolerance)
-            
-            centers.append(center)
-            lower_bounds.append(low)
-            upper_bounds.append(high)
-            bond_types.append(bond_type)
-            functional_groups.append(functional_group)
-            compounds.append(compound)
-        except ValueError as e:
-            logger.warning(f"Unable to process wavenumber value '{wavenumber_value}' at index {index}: {e}")
-            continue
+    # Parse all wavenumber strings in one vectorized pass: a single value,
+    # a 'low-high' range, or a 'center±uncertainty' form.
+    raw = reference['Wavenumbers (cm-1)'].astype(str).str.replace('cm-1', '', regex=False)
+    parts = raw.str.extract(_WAVENUMBER_PATTERN)
+    base = pd.to_numeric(parts['a'], errors='coerce')
+    second = pd.to_numeric(parts['b'], errors='coerce')
+    separator = parts['sep']
+
+    is_range = separator.eq('-') & second.notna()
+    is_uncertainty = separator.eq('±') & second.notna()
+
+    centers = np.where(is_range, (base + second) / 2, base)
+    lower_bounds = np.where(
+        is_range, base,
+        np.where(is_uncertainty, base - second, base * (1 - tolerance))
+    )
+    upper_bounds = np.where(
+        is_range, second,
+        np.where(is_uncertainty, base + second, base * (1 + tolerance))
+    )
 
+    valid = base.notna() & ~(separator.notna() & second.isna())
+    if not valid.all():
+        bad_values = reference.loc[~valid, 'Wavenumbers (cm-1)'].tolist()
+        logger.warning(f"Unable to process wavenumber value(s): {bad_values}")
+
+    valid_mask = valid.to_numpy()
+    centers = centers[valid_mask]
+    lower_bounds = lower_bounds[valid_mask]
+    upper_bounds = upper_bounds[valid_mask]
+    bond_types = reference.loc[valid, 'Bond Type'].to_numpy()
+    functional_groups = reference.loc[valid, 'Functional Group'].to_numpy()
+    compounds = reference.loc[valid, 'Compound'].to_numpy()
+
+    # float32 holds IR wavenumbers exactly at the precision that matters
+    # (four significant digits with a ±5% tolerance) and halves the memory
+    # traffic of the broadcast bound checks in the matching kernel.
+    centers = np.asarray(centers, dtype=np.float32)
     processed_reference = pd.DataFrame({
         'Center': centers,
-        'Lower Bound': lower_bounds,
-        'Upper Bound': upper_bounds,
+        'Lower Bound': np.asarray(lower_bounds, dtype=np.float32),
+        'Upper Bound': np.asarray(upper_bounds, dtype=np.float32),
         'Bond Type': bond_types,
         'Functional Group': functional_groups,
         'Compound': compounds
     })
 
+    # Pre-sorted view of the centers so nearest-center lookups can binary
+    # search instead of scanning; sort_order maps sorted positions back to
+    # reference rows. Travels with the DataFrame (and its pickle cache).
+    # Stored as tuples, not arrays: pandas compares attrs with == when
+    # propagating them (__finalize__), and ndarray == ndarray there raises
+    # "truth value of an array is ambiguous" on e.g. astype or concat.
+    sort_order = np.argsort(centers, kind='stable')
+    processed_reference.attrs['sort_order'] = tuple(sort_order.tolist())
+    processed_reference.attrs['centers_sorted'] = tuple(centers[sort_order].tolist())
+
     return processed_reference
 
-def calculate_transmittance(data):
+def calculate_transmittance(data: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate Transmittance (%) from Absorbance.
 
@@ -102,85 +190,189 @@ def calculate_transmittance(data):
     Returns:
         pd.DataFrame: Updated DataFrame with 'transmittance'.
     """
-    data['transmittance'] = (10 ** (-data['absorbance'])) * 100
+    # Fused in-place conversion: negate into one buffer, exponentiate and
+    # scale it there instead of allocating three intermediates.
+    transmittance = np.negative(data['absorbance'].to_numpy(dtype=np.float64))
+    np.power(10.0, transmittance, out=transmittance)
+    transmittance *= 100.0
+    data['transmittance'] = transmittance
     return data
 
-def detect_peaks_and_match(data, reference_data, prominence=0.005):
+def _pipeline_core(wavenumbers: np.ndarray, absorbance: np.ndarray,
+                   lower_bounds: np.ndarray, upper_bounds: np.ndarray,
+                   centers_sorted: np.ndarray, sort_order: np.ndarray,
+                   prominence: float = 0.005) -> tuple:
     """
-    Detect peaks in Absorbance data and match to reference data.
+    Numeric core of the peak pipeline: smooth, detect, and match.
+
+    Operates purely on numpy arrays (no strings, no DataFrames) so the hot
+    path stays inside compiled numpy/scipy code; callers attach the string
+    columns afterwards.
 
     Args:
-        data (pd.DataFrame): DataFrame with 'wavenumber' and 'absorbance'.
-        reference_data (pd.DataFrame): Processed reference data.
+        wavenumbers (np.ndarray): Wavenumbers sorted in ascending order.
+        absorbance (np.ndarray): Absorbance values aligned to wavenumbers.
+        lower_bounds (np.ndarray): Reference interval lower bounds.
+        upper_bounds (np.ndarray): Reference interval upper bounds.
+        centers_sorted (np.ndarray): Reference interval centers, ascending.
+        sort_order (np.ndarray): Maps sorted center positions to reference rows.
         prominence (float): Prominence parameter for peak detection.
 
     Returns:
-        pd.DataFrame: Detected peaks with matching functional groups.
+        tuple: (peak_positions, smoothed_absorbance, peak_idx, ref_idx,
+        approximate) where peak_idx/ref_idx index into peak_positions and
+        the reference arrays respectively, and approximate flags rows that
+        were matched to the nearest center rather than a containing interval.
     """
-    # Ensure data is sorted by wavenumber in ascending order
-    data = data.sort_values(by='wavenumber').reset_index(drop=True)
-
     # Smooth the absorbance data
-    window_length = 15 if len(data) >= 15 else len(data) - (len(data) % 2 == 0)
+    n = wavenumbers.shape[0]
+    window_length = 15 if n >= 15 else n - (n % 2 == 0)
     if window_length < 5:
         window_length = 5  # Minimum window length
-    data['smoothed_absorbance'] = savgol_filter(
-        data['absorbance'], window_length=window_length, polyorder=3
+    smoothed_absorbance = savgol_filter(
+        absorbance, window_length=window_length, polyorder=3
     )
 
     # Detect peaks in the smoothed absorbance data
-    peaks, properties = find_peaks(
-        data['smoothed_absorbance'],
-        prominence=prominence
+    peaks, properties = find_peaks(smoothed_absorbance, prominence=prominence)
+    if peaks.size == 0:
+        empty_idx = np.empty(0, dtype=np.intp)
+        return peaks, smoothed_absorbance, empty_idx, empty_idx, np.empty(0, dtype=bool)
+    peak_wavenumbers = wavenumbers[peaks]
+
+    # Exact matches: every reference row whose [lower, upper] interval
+    # contains the peak. One boolean matrix covers all (peak, reference)
+    # pairs instead of a Python loop over rows.
+    inside = (
+        (lower_bounds[None, :] <= peak_wavenumbers[:, None]) &
+        (peak_wavenumbers[:, None] <= upper_bounds[None, :])
     )
-    peak_data = data.iloc[peaks].copy()
-    peak_data.reset_index(drop=True, inplace=True)
-
-    matched_peaks = []
-
-    for idx, peak in peak_data.iterrows():
-        wavenumber = peak['wavenumber']
-        absorbance_value = peak['smoothed_absorbance']
-
-        # Calculate transmittance for the peak
-        transmittance_value = 10 ** (-absorbance_value) * 100
-
-        # Match peak to reference data within the specified tolerance
-        matches = reference_data[
-            (reference_data['Lower Bound'] <= wavenumber) &
-            (wavenumber <= reference_data['Upper Bound'])
-        ]
-
-        if not matches.empty:
-            # Exact match: Add all matches within the range
-            for _, ref_row in matches.iterrows():
-                matched_peaks.append({
-                    'wavenumber': wavenumber,
-                    'absorbance': absorbance_value,
-                    'transmittance': transmittance_value,
-                    'Bond Type': ref_row['Bond Type'],
-                    'Functional Group': ref_row['Functional Group'],
-                    'Compound': ref_row['Compound']
-                })
-        else:
-            # Approximate match: Find the closest match outside the range
-            reference_data['Distance'] = abs(reference_data['Center'] - wavenumber)
-            closest_match = reference_data.loc[reference_data['Distance'].idxmin()]
-            matched_peaks.append({
-                'wavenumber': wavenumber,
-                'absorbance': absorbance_value,
-                'transmittance': transmittance_value,
-                'Bond Type': closest_match['Bond Type'] + ' (approximate)',
-                'Functional Group': closest_match['Functional Group'],
-                'Compound': closest_match['Compound']
-            })
-            reference_data.drop(columns=['Distance'], inplace=True)
-
-    matched_peaks_df = pd.DataFrame(matched_peaks)
+    peak_idx, ref_idx = np.nonzero(inside)
+    approximate = np.zeros(peak_idx.shape[0], dtype=bool)
+
+    # Approximate matches: peaks that fall in no interval take the single
+    # nearest reference center, found by binary search into the pre-sorted
+    # centers (O(log R) per peak rather than a full scan).
+    unmatched = np.nonzero(~inside.any(axis=1))[0]
+    if unmatched.size:
+        unmatched_wn = peak_wavenumbers[unmatched]
+        last = centers_sorted.shape[0] - 1
+        pos = np.searchsorted(centers_sorted, unmatched_wn)
+        left = np.clip(pos - 1, 0, last)
+        right = np.clip(pos, 0, last)
+        left_dist = np.abs(centers_sorted[left] - unmatched_wn)
+        right_dist = np.abs(centers_sorted[right] - unmatched_wn)
+        # Resolve each neighbour to the first row of its duplicate-center
+        # run, and break exact-distance ties towards the lower table row —
+        # the same winners the old full-scan argmin produced.
+        left_row = sort_order[np.searchsorted(centers_sorted, centers_sorted[left])]
+        right_row = sort_order[np.searchsorted(centers_sorted, centers_sorted[right])]
+        nearest = np.where(
+            left_dist < right_dist, left_row,
+            np.where(right_dist < left_dist, right_row,
+                     np.minimum(left_row, right_row))
+        )
+        peak_idx = np.concatenate([peak_idx, unmatched])
+        ref_idx = np.concatenate([ref_idx, nearest])
+        approximate = np.concatenate(
+            [approximate, np.ones(unmatched.shape[0], dtype=bool)]
+        )
+
+    # Restore per-peak output order (exact and approximate rows interleaved
+    # by peak position, as the row-wise loop used to produce).
+    order = np.argsort(peak_idx, kind='stable')
+    return peaks, smoothed_absorbance, peak_idx[order], ref_idx[order], approximate[order]
+
+# Prototype of the detected-peaks schema; zero-peak spectra return a copy of
+# this instead of materializing columns.
+_EMPTY_DETECTED = pd.DataFrame({
+    'wavenumber': pd.Series(dtype=np.float32),
+    'absorbance': pd.Series(dtype=np.float32),
+    'transmittance': pd.Series(dtype=np.float32),
+    'Bond Type': pd.Series(dtype='category'),
+    'Functional Group': pd.Series(dtype='category'),
+    'Compound': pd.Series(dtype='category'),
+})
+
+def detect_peaks_and_match(wavenumbers, absorbance, reference_data: pd.DataFrame,
+                           prominence: float = 0.005) -> pd.DataFrame:
+    """
+    Detect peaks in Absorbance data and match to reference data.
+
+    Args:
+        wavenumbers (array-like): Wavenumber values.
+        absorbance (array-like): Absorbance values aligned to wavenumbers.
+        reference_data (pd.DataFrame): Processed reference data.
+        prominence (float): Prominence parameter for peak detection.
+
+    Returns:
+        pd.DataFrame: Detected peaks with matching functional groups.
+    """
+    wavenumbers = np.ascontiguousarray(wavenumbers, dtype=np.float32)
+    absorbance = np.ascontiguousarray(absorbance, dtype=np.float32)
+
+    # Ensure data is sorted by wavenumber in ascending order
+    if wavenumbers.size > 1 and np.any(np.diff(wavenumbers) < 0):
+        order = np.argsort(wavenumbers, kind='stable')
+        wavenumbers = wavenumbers[order]
+        absorbance = absorbance[order]
+
+    centers_sorted = reference_data.attrs.get('centers_sorted')
+    sort_order = reference_data.attrs.get('sort_order')
+    if centers_sorted is None or sort_order is None:
+        # Reference frames not built by process_reference_data still work;
+        # they just pay the sort here.
+        centers = np.ascontiguousarray(reference_data['Center'].to_numpy(), dtype=np.float32)
+        sort_order = np.argsort(centers, kind='stable')
+        centers_sorted = centers[sort_order]
+    else:
+        # attrs hold tuples (see _parse_reference_excel); restore the
+        # dtypes the matching kernel expects.
+        centers_sorted = np.asarray(centers_sorted, dtype=np.float32)
+        sort_order = np.asarray(sort_order, dtype=np.intp)
+
+    peaks, smoothed_absorbance, peak_idx, ref_idx, approximate = _pipeline_core(
+        wavenumbers,
+        absorbance,
+        np.ascontiguousarray(reference_data['Lower Bound'].to_numpy(), dtype=np.float32),
+        np.ascontiguousarray(reference_data['Upper Bound'].to_numpy(), dtype=np.float32),
+        centers_sorted,
+        sort_order,
+        prominence=prominence,
+    )
+
+    if peaks.size == 0:
+        return _EMPTY_DETECTED.copy()
+
+    peak_wavenumbers = wavenumbers[peaks]
+    peak_absorbances = smoothed_absorbance[peaks]
+    peak_transmittances = np.negative(peak_absorbances)
+    np.power(10.0, peak_transmittances, out=peak_transmittances)
+    peak_transmittances *= 100.0
+
+    bond_types = reference_data['Bond Type'].to_numpy(dtype=object)[ref_idx]
+    if approximate.any():
+        bond_types = np.where(approximate, bond_types + ' (approximate)', bond_types)
+
+    # Materialize columns once; categoricals keep the string columns cheap
+    # for the downstream groupby in generate_report.
+    matched_peaks_df = pd.DataFrame({
+        'wavenumber': peak_wavenumbers[peak_idx],
+        'absorbance': peak_absorbances[peak_idx],
+        'transmittance': peak_transmittances[peak_idx],
+        'Bond Type': pd.Categorical(bond_types),
+        'Functional Group': pd.Categorical(
+            reference_data['Functional Group'].to_numpy(dtype=object)[ref_idx]
+        ),
+        'Compound': pd.Categorical(
+            reference_data['Compound'].to_numpy(dtype=object)[ref_idx]
+        ),
+    }, copy=False)
 
     return matched_peaks_df
 
-def group_and_filter_peaks_dynamic(peaks, group_by='Bond Type', sort_by='wavenumber', top_n=6):
+def group_and_filter_peaks_dynamic(peaks: pd.DataFrame, group_by: str = 'Bond Type',
+                                   sort_by: str = 'wavenumber', top_n=6) -> pd.DataFrame:
     """
     Dynamically group and filter detected peaks based on specified criteria.
 
@@ -202,18 +394,22 @@ def group_and_filter_peaks_dynamic(peaks, group_by='Bond Type', sort_by='wavenum
     if sort_by not in peaks.columns:
         raise ValueError(f"Sorting column '{sort_by}' not found in the DataFrame.")
 
-    # Group and sort peaks
-    grouped_peaks = peaks.groupby(group_by, group_keys=False).apply(
+    # Group and sort peaks. observed=True skips categories with no rows
+    # (the columns are categoricals) and is pandas 3's default; passing it
+    # explicitly silences the FutureWarning without changing the output.
+    grouped_peaks = peaks.groupby(group_by, group_keys=False, observed=True).apply(
         lambda group: group.sort_values(by=sort_by, ascending=True)
     ).reset_index(drop=True)
 
     if top_n is not None:
         # Retain only top N peaks per group
-        grouped_peaks = grouped_peaks.groupby(group_by, group_keys=False).head(top_n)
+        grouped_peaks = grouped_peaks.groupby(
+            group_by, group_keys=False, observed=True
+        ).head(top_n)
 
     return grouped_peaks
 
-def generate_report(detected_peaks, report_type='absorbance'):
+def generate_report(detected_peaks: pd.DataFrame, report_type: str = 'absorbance'):
     """
     Generates a report based on the detected peaks.
 
@@ -221,17 +417,17 @@ def generate_report(detected_peaks, report_type='absorbance'):
         detected_peaks (pd.DataFrame): DataFrame containing detected peaks and their matches.
         report_type (str): 'absorbance' or 'transmittance' to indicate which data to include.
 
-    Returns:
-        list: List of report lines.
+    Yields:
+        str: Report lines, one per bond type; wrap in list() where a
+        materialized report is needed.
     """
     if detected_peaks.empty:
-        return ["No peaks were detected or matched to the reference data."]
-
-    report_lines = []
+        yield "No peaks were detected or matched to the reference data."
+        return
 
     # Group peaks by 'Bond Type' and sort wavenumbers ascending
     detected_peaks = detected_peaks.sort_values(by='wavenumber', ascending=True)
-    group_peaks = detected_peaks.groupby('Bond Type', sort=False)
+    group_peaks = detected_peaks.groupby('Bond Type', sort=False, observed=True)
 
     for bond_type, group_data in group_peaks:
         wavenumbers = group_data['wavenumber'].unique()
@@ -244,9 +440,7 @@ def generate_report(detected_peaks, report_type='absorbance'):
         else:
             line = f"The peak positions at {wavenumber_list} represent the {bond_type} bond type in functional group(s): {functional_group_list}."
 
-        report_lines.append(line)
-
-    return report_lines
+        yield line
 
 # Main function for testing
 if __name__ == '__main__':
@@ -272,12 +466,17 @@ if __name__ == '__main__':
     reference_data = process_reference_data(reference_path)
 
     # Detect peaks and match to functional groups
-    detected_peaks = detect_peaks_and_match(data_df, reference_data, prominence=0.005)
+    detected_peaks = detect_peaks_and_match(
+        data_df['wavenumber'].to_numpy(),
+        data_df['absorbance'].to_numpy(),
+        reference_data,
+        prominence=0.005
+    )
 
     # Group and filter peaks
     grouped_peaks = group_and_filter_peaks_dynamic(detected_peaks, group_by='Bond Type', sort_by='wavenumber')
 
-    # Generate the report
+    # Generate the report (lazily, one line per bond type)
     report = generate_report(grouped_peaks)
 
     # Output the report
@@ -0,0 +1,21 @@
+import orjson
+
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    orjson encodes in C with native numpy support, so the large
+    wavenumber/transmittance/absorbance arrays are serialized without
+    boxing every element into a Python float first.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
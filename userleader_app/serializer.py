@@ -1,7 +1,9 @@
+from django.core.validators import FileExtensionValidator
 from rest_framework import serializers
 from .models import *
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
+from .tokens import CacheDenylistRefreshToken
 
 
 class CustomUserSerializer(serializers.ModelSerializer):
@@ -32,6 +34,11 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
 
 
+class CacheDenylistTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refresh serializer that honors the cache-backed deny-list."""
+    token_class = CacheDenylistRefreshToken
+
+
 class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField()
 
@@ -42,4 +49,6 @@ class ChangePasswordSerializer(serializers.Serializer):
 
 
 class CSVSerializer(serializers.Serializer):
-    file = serializers.FileField()
+    file = serializers.FileField(
+        validators=[FileExtensionValidator(allowed_extensions=['csv'])]
+    )
@@ -0,0 +1,47 @@
+import os
+import logging
+
+import numpy as np
+from celery import shared_task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .views import analyze_spectrum
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def blacklist_refresh_token(refresh_token):
+    """
+    Write a refresh token to the blacklist table off-request.
+
+    LogoutView verifies the token's signature and expiry before
+    enqueueing, so this only performs the DB write.
+    """
+    RefreshToken(refresh_token).blacklist()
+
+
+@shared_task
+def run_spectrum_analysis(file_path, report_type='absorbance', mode='both'):
+    """
+    Run the spectrum analysis pipeline on a spooled upload.
+
+    The view writes the uploaded CSV to a temp file and enqueues this
+    task; the file is removed once processed. Arrays in the payload are
+    converted to lists so the result is JSON-serializable for the result
+    backend.
+    """
+    try:
+        with open(file_path, 'rb') as file_obj:
+            payload = analyze_spectrum(file_obj, report_type, mode)
+    finally:
+        try:
+            os.unlink(file_path)
+        except OSError as e:
+            logger.warning(f"Could not remove spooled upload {file_path}: {e}")
+
+    payload['data'] = {
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in payload['data'].items()
+    }
+    return payload
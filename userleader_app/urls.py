@@ -8,7 +8,8 @@ from .views import (
     SigninView,
     LogoutView,
     ChangePasswordView,
-    DataHandlingView
+    DataHandlingView,
+    AnalysisStatusView
 )
 
 urlpatterns = [
@@ -20,4 +21,5 @@ urlpatterns = [
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
     path('password_reset/', include('django_rest_passwordreset.urls', namespace='password_reset')),
     path('file-handling/', DataHandlingView.as_view(), name='file_handling'),
+    path('file-handling/status/<str:task_id>/', AnalysisStatusView.as_view(), name='file_handling_status'),
 ]
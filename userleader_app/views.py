@@ -1,4 +1,4 @@
-from django.shortcuts import render
+from django.conf import settings
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -13,7 +13,7 @@ from .models import CustomUser
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth.hashers import check_password
+from .tokens import CacheDenylistRefreshToken
 from drf_yasg.utils import swagger_auto_schema
 from .peak_detection import (
     process_reference_data,
@@ -23,17 +23,300 @@ from .peak_detection import (
     generate_report
 )
 from .integrateModel import predict_most_frequent_name
+import concurrent.futures
+import functools
+import hashlib
+import io
 import os
 import logging
+import tempfile
 import traceback
-import pandas as pd
-from io import StringIO
+
+import orjson
+from pathlib import Path
 import numpy as np  # Ensure numpy is imported
-from .csv_read import csv_read  # Import your csv_read module
+from .csv_read import csv_read, csv_read_fast  # Import your csv_read module
 
-# Initialize logger
+# Initialize logger (configured via settings.LOGGING)
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+# Runs the RF prediction alongside the peak pipeline; numpy/scikit-learn
+# release the GIL in their C kernels, so the two stages genuinely overlap.
+_PREDICTION_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='spectrum-predict'
+)
+
+# Model and reference data locations, resolved once at import
+_APP_DIR = Path(__file__).resolve().parent
+MODEL_PATH = _APP_DIR / 'models' / 'best_rf_model.pkl'
+REFERENCE_PATH = _APP_DIR / 'data' / 'IR_Correlation_Table_5000_to_250.xlsx'
+
+@functools.lru_cache(maxsize=1)
+def _load_reference(reference_path, mtime):
+    """Memoized reference load; mtime keys the cache so edits invalidate."""
+    return process_reference_data(reference_path)
+
+# Result cache for repeat uploads (users re-submit the same spectrum while
+# tuning report_type): payloads are stored as JSON under a content-hash key
+# and the directory is bounded by evicting the least recently used entries.
+# JSON (not pickle) on purpose: the directory lives under the shared temp
+# dir, and unpickling a file another local user could have planted there
+# would execute their code. The directory is also created 0700.
+_SPECTRUM_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'userleader-spectrum-cache')
+_SPECTRUM_CACHE_MAX_ENTRIES = 32
+
+def _content_hash(file_obj):
+    """Hash the upload in chunks and rewind it; None if it can't be read."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        file_obj.seek(0)
+        for chunk in iter(lambda: file_obj.read(1 << 20), b''):
+            digest.update(chunk)
+        file_obj.seek(0)
+    except (OSError, ValueError):
+        return None
+    return digest.hexdigest()
+
+def _spectrum_cache_get(cache_key):
+    path = os.path.join(_SPECTRUM_CACHE_DIR, cache_key + '.json')
+    try:
+        with open(path, 'rb') as cached:
+            payload = orjson.loads(cached.read())
+        os.utime(path)  # refresh for LRU eviction
+        return payload
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _spectrum_cache_put(cache_key, payload):
+    try:
+        os.makedirs(_SPECTRUM_CACHE_DIR, mode=0o700, exist_ok=True)
+        path = os.path.join(_SPECTRUM_CACHE_DIR, cache_key + '.json')
+        fd, tmp_path = tempfile.mkstemp(dir=_SPECTRUM_CACHE_DIR)
+        with os.fdopen(fd, 'wb') as tmp:
+            # Same options as the response renderer, so a cache hit is
+            # byte-for-byte what the miss path would have serialized.
+            tmp.write(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY, default=str))
+        os.replace(tmp_path, path)  # atomic under concurrent workers
+
+        # Evict the oldest entries beyond the cap
+        entries = []
+        with os.scandir(_SPECTRUM_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    entries.append((entry.stat().st_mtime, entry.path))
+        if len(entries) > _SPECTRUM_CACHE_MAX_ENTRIES:
+            entries.sort()
+            for _, stale in entries[:len(entries) - _SPECTRUM_CACHE_MAX_ENTRIES]:
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+    except OSError as e:
+        logger.warning("Could not write spectrum cache entry: %s", e)
+
+class SpectrumProcessingError(ValueError):
+    """Pipeline failure carrying the HTTP status the API should return."""
+
+    def __init__(self, message, status_code=status.HTTP_400_BAD_REQUEST):
+        super().__init__(message)
+        self.status_code = status_code
+
+def analyze_spectrum(file_obj, report_type='absorbance', mode='both'):
+    """
+    Run the full analysis pipeline on an uploaded spectrum CSV.
+
+    Parses the file, converts between absorbance and transmittance, runs
+    peak detection plus reference matching, and predicts the compound.
+    Shared by the synchronous request path and the Celery task.
+
+    Args:
+        file_obj: Seekable binary file-like object with the CSV content.
+        report_type (str): 'absorbance' or 'transmittance'.
+        mode (str): 'peaks', 'predict', or 'both' — clients wanting only
+            one output skip the other stage entirely.
+
+    Returns:
+        dict: Response payload with compound_name, peak_report, and the
+        spectrum arrays (compound_name is None in 'peaks' mode, the
+        report empty in 'predict' mode).
+
+    Raises:
+        SpectrumProcessingError: On invalid input (400) or missing
+        model/reference artifacts and prediction failures (500).
+    """
+    report_type = (report_type or 'absorbance').lower()
+    if report_type not in ('absorbance', 'transmittance'):
+        report_type = 'absorbance'
+    mode = (mode or 'both').lower()
+    if mode not in ('peaks', 'predict', 'both'):
+        mode = 'both'
+
+    # Identical uploads short-circuit to the cached payload
+    content_hash = _content_hash(file_obj)
+    if content_hash is not None:
+        cache_key = f"{content_hash}-{report_type}-{mode}"
+        cached = _spectrum_cache_get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached analysis for upload %s.", content_hash)
+            return cached
+
+    # Parse the CSV: fast path streams the upload through pandas' C
+    # engine; irregular layouts (preamble rows, header synonyms spread
+    # over several lines) fall back to csv_read.
+    try:
+        file_data = csv_read_fast(file_obj)
+        if file_data is None:
+            file_obj.seek(0)
+            try:
+                # Stream-decode the upload line by line instead of holding
+                # a bytes buffer plus a full str copy in memory at once.
+                file_data = csv_read(
+                    io.TextIOWrapper(file_obj, encoding='utf-8', newline='')
+                )
+            except UnicodeDecodeError as ude:
+                logger.error(f"Unicode decode error: {ude}")
+                raise SpectrumProcessingError('File encoding not supported. Please upload a UTF-8 encoded file.')
+        logger.debug("CSV data keys: %s", list(file_data))
+
+        # Check for required data
+        if 'wavenumber' not in file_data or ('absorbance' not in file_data and 'transmittance' not in file_data):
+            raise ValueError("Uploaded file must contain 'wavenumber' and 'absorbance' or 'transmittance' columns.")
+
+        # Ensure data arrays have the same length and collect valid indices
+        wavenumber = np.asarray(file_data['wavenumber'], dtype=np.float64)
+        logger.debug("wavenumber length: %d", len(wavenumber))
+
+        if 'absorbance' in file_data:
+            absorbance = np.asarray(file_data['absorbance'], dtype=np.float64)
+            logger.debug("absorbance length: %d", len(absorbance))
+            if len(wavenumber) != len(absorbance):
+                raise ValueError("Data columns have mismatched lengths.")
+            # Fused in-place conversion: one output buffer, no
+            # -absorbance / 10**x / *100 temporaries.
+            transmittance = np.negative(absorbance)
+            np.power(10.0, transmittance, out=transmittance)
+            transmittance *= 100.0
+        else:
+            transmittance = np.asarray(file_data['transmittance'], dtype=np.float64)
+            logger.debug("transmittance length: %d", len(transmittance))
+            if len(wavenumber) != len(transmittance):
+                raise ValueError("Data columns have mismatched lengths.")
+            # Convert transmittance to absorbance in one buffer
+            absorbance = transmittance / 100.0
+            np.log10(absorbance, out=absorbance)
+            np.negative(absorbance, out=absorbance)
+
+        # Keep only rows where every column is a finite number, then sort
+        # by wavenumber — plain numpy instead of a throwaway DataFrame
+        # round-trip.
+        valid = (
+            np.isfinite(wavenumber) &
+            np.isfinite(absorbance) &
+            np.isfinite(transmittance)
+        )
+        if not valid.all():
+            wavenumber = wavenumber[valid]
+            absorbance = absorbance[valid]
+            transmittance = transmittance[valid]
+
+        order = np.argsort(wavenumber, kind='stable')
+        wavenumber = wavenumber[order]
+        absorbance = absorbance[order]
+        transmittance = transmittance[order]
+
+        logger.info("CSV data processed successfully.")
+
+    except SpectrumProcessingError:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing CSV file: {e}")
+        raise SpectrumProcessingError(f'Error processing CSV file: {e}')
+
+    # Ensure necessary data is present
+    if wavenumber.size == 0:
+        logger.error("CSV file contains no valid data.")
+        raise SpectrumProcessingError("Uploaded file contains no valid data.")
+
+    run_peaks = mode in ('peaks', 'both')
+    run_predict = mode in ('predict', 'both')
+
+    # Check that the artifacts the requested stages need exist
+    if run_predict and not MODEL_PATH.exists():
+        logger.error(f"Model file not found at: {MODEL_PATH}")
+        raise SpectrumProcessingError('Model file not found. Please check the model path.',
+                                      status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if run_peaks and not REFERENCE_PATH.exists():
+        logger.error(f"Reference file not found at: {REFERENCE_PATH}")
+        raise SpectrumProcessingError('Reference file not found. Please check the path.',
+                                      status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    logger.info("Model and reference files verified.")
+
+    # The RF prediction is independent of peak matching, so kick it off in
+    # the worker pool and overlap it with the peak pipeline below.
+    prediction_future = None
+    if run_predict:
+        logger.info("Running model prediction.")
+        prediction_future = _PREDICTION_POOL.submit(
+            predict_most_frequent_name, wavenumber, absorbance, model_path=MODEL_PATH
+        )
+
+    peak_report = []
+    if run_peaks:
+        # Peak detection and functional group matching
+        logger.info("Processing reference data for peak detection.")
+        reference_data = _load_reference(REFERENCE_PATH, REFERENCE_PATH.stat().st_mtime)
+        logger.info("Reference data processed successfully.")
+
+        # Detect peaks and match
+        detected_peaks = detect_peaks_and_match(wavenumber, absorbance, reference_data, prominence=0.005)
+        # Rendering the whole DataFrame is expensive; only do it when someone
+        # is actually listening at DEBUG.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detected peaks:\n%s", detected_peaks)
+
+        # Group and filter peaks
+        grouped_peaks = group_and_filter_peaks_dynamic(detected_peaks, group_by='Bond Type', sort_by='wavenumber')
+
+        if grouped_peaks.empty:
+            logger.warning("No peaks were detected or matched to the reference data.")
+            peak_report = ["No peaks were detected or matched to the reference data."]
+        else:
+            # Honor the user's choice for report type (Absorbance or Transmittance)
+            peak_report = list(generate_report(grouped_peaks, report_type=report_type))
+            logger.info("Peak detection completed successfully.")
+
+    # Join the prediction started before peak detection
+    compound_name = None
+    if prediction_future is not None:
+        try:
+            compound_name = prediction_future.result()
+            logger.info("Model prediction completed successfully. Predicted compound name: %s", compound_name)
+        except Exception as e:
+            logger.error(f"Error during compound prediction: {e}")
+            logger.debug(traceback.format_exc())
+            raise SpectrumProcessingError('Error during compound prediction.',
+                                          status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # Round the response arrays in place — one pass per buffer, no Series
+    # or list copies — which also keeps the serialized floats short.
+    np.round(transmittance, 4, out=transmittance)
+    np.round(absorbance, 6, out=absorbance)
+
+    logger.info("File processed successfully.")
+    payload = {
+        "compound_name": compound_name,
+        "peak_report": peak_report,
+        "data": {
+            # ndarrays are serialized natively by the orjson renderer
+            "wavenumber": wavenumber,
+            "transmittance": transmittance,
+            "absorbance": absorbance
+        }
+    }
+    if content_hash is not None:
+        _spectrum_cache_put(cache_key, payload)
+    return payload
 
 # CustomUser views
 class CustomUserCreateView(generics.CreateAPIView):
@@ -51,8 +334,22 @@ class LogoutView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         try:
             refresh_token = request.data.get("refresh_token")
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+            # Verifies signature and expiry; invalid tokens 400 here
+            if settings.TOKEN_DENYLIST_CACHE:
+                # Always revoke in-request: the deny-list write is the one
+                # cheap cache SETEX that LOGOUT_SYNC=False exists to avoid,
+                # and the async task writes to the token_blacklist tables
+                # the cache-backed refresh path never consults.
+                CacheDenylistRefreshToken(refresh_token).blacklist()
+            elif settings.LOGOUT_SYNC:
+                RefreshToken(refresh_token).blacklist()
+            else:
+                # Offload the blacklist DB write; the client only needs
+                # the acknowledgement, not the write itself. Construct
+                # first so invalid tokens still 400 before enqueueing.
+                RefreshToken(refresh_token)
+                from .tasks import blacklist_refresh_token
+                blacklist_refresh_token.delay(refresh_token)
             return Response(status=status.HTTP_205_RESET_CONTENT)
         except Exception as e:
             logger.error(f"Logout error: {e}")
@@ -68,7 +365,9 @@ class ChangePasswordView(generics.CreateAPIView):
             old_password = serializer.validated_data.get('old_password')
             new_password = serializer.validated_data.get('new_password')
 
-            if not check_password(old_password, request.user.password):
+            # user.check_password passes the hash-upgrade setter, so
+            # outdated hashes are rewritten with the current hasher here.
+            if not request.user.check_password(old_password):
                 return Response({"message": "Old password is incorrect."}, status=status.HTTP_400_BAD_REQUEST)
 
             request.user.set_password(new_password)
@@ -87,147 +386,68 @@ class DataHandlingView(generics.CreateAPIView):
         logger.info("Received request for file handling.")
 
         try:
-            # File validation
-            if 'file' not in request.data:
-                logger.warning('No file provided in the request.')
-                return Response({'error': 'No file provided. Please upload a CSV file.'}, status=status.HTTP_400_BAD_REQUEST)
-
-            uploaded_file = request.data['file']
-            file_extension = uploaded_file.name.split('.')[-1]
-            if file_extension.lower() != 'csv':
-                logger.warning('Invalid file format uploaded.')
-                return Response({'error': 'Invalid file format. Please upload a CSV file.'}, status=status.HTTP_400_BAD_REQUEST)
-
-            logger.info("File uploaded successfully.")
-
-            # Read CSV content
+            # Constant-time size check before touching the body: a hostile
+            # oversized upload should cost a header read, not a worker.
             try:
-                file_content = uploaded_file.read().decode('utf-8')
-            except UnicodeDecodeError as ude:
-                logger.error(f"Unicode decode error: {ude}")
-                return Response({'error': 'File encoding not supported. Please upload a UTF-8 encoded file.'}, status=status.HTTP_400_BAD_REQUEST)
+                content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+            except (TypeError, ValueError):
+                content_length = 0
+            if content_length > settings.MAX_UPLOAD_SIZE:
+                logger.warning("Rejected upload of %d bytes (limit %d).",
+                               content_length, settings.MAX_UPLOAD_SIZE)
+                return Response(
+                    {'error': 'Uploaded file is too large.'},
+                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
 
-            logger.info(f"File content preview: {file_content[:100]}")  # Log first 100 characters
+            # File validation; repeating the 'file' field uploads a batch
+            uploaded_files = request.FILES.getlist('file')
+            if not uploaded_files:
+                logger.warning('No file provided in the request.')
+                return Response({'error': 'No file provided. Please upload a CSV file.'}, status=status.HTTP_400_BAD_REQUEST)
 
-            # Read CSV using your custom csv_read function
-            try:
-                file_data = csv_read(file_content)
-                logger.debug(f"CSV data keys: {file_data.keys()}")
-
-                # Check for required data
-                if 'wavenumber' not in file_data or ('absorbance' not in file_data and 'transmittance' not in file_data):
-                    raise ValueError("Uploaded file must contain 'wavenumber' and 'absorbance' or 'transmittance' columns.")
-
-                # Ensure data arrays have the same length and collect valid indices
-                wavenumber = file_data['wavenumber']
-                logger.debug(f"wavenumber type: {type(wavenumber)}, length: {len(wavenumber)}")
-
-                if 'absorbance' in file_data:
-                    absorbance = file_data['absorbance']
-                    logger.debug(f"absorbance type: {type(absorbance)}, length: {len(absorbance)}")
-                    if len(wavenumber) != len(absorbance):
-                        raise ValueError("Data columns have mismatched lengths.")
-                    transmittance = (10 ** (-np.array(absorbance))) * 100
-                else:
-                    transmittance = file_data['transmittance']
-                    logger.debug(f"transmittance type: {type(transmittance)}, length: {len(transmittance)}")
-                    if len(wavenumber) != len(transmittance):
-                        raise ValueError("Data columns have mismatched lengths.")
-                    # Convert transmittance to absorbance
-                    transmittance_array = np.array(transmittance)
-                    absorbance = -np.log10(transmittance_array / 100)
-
-                data_df = pd.DataFrame({
-                    'wavenumber': wavenumber,
-                    'absorbance': absorbance,
-                    'transmittance': transmittance
-                })
-
-                data_df['wavenumber'] = pd.to_numeric(data_df['wavenumber'], errors='coerce')
-                data_df['absorbance'] = pd.to_numeric(data_df['absorbance'], errors='coerce')
-                data_df['transmittance'] = pd.to_numeric(data_df['transmittance'], errors='coerce')
-
-                data_df.dropna(subset=['wavenumber', 'absorbance', 'transmittance'], inplace=True)
-                data_df.sort_values(by='wavenumber', inplace=True)
-
-                logger.info("CSV data processed successfully.")
-
-            except Exception as e:
-                logger.error(f"Error processing CSV file: {e}")
-                return Response({'error': f'Error processing CSV file: {e}'}, status=status.HTTP_400_BAD_REQUEST)
-
-            # Ensure necessary data is present
-            if data_df.empty:
-                logger.error("CSV file contains no valid data.")
-                return Response({'error': "Uploaded file contains no valid data."}, status=status.HTTP_400_BAD_REQUEST)
-
-            # Proceed with processing data_df
-
-            # Path setup for model and reference data
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            model_path = os.path.join(current_dir, 'models', 'best_rf_model.pkl')
-            reference_path = os.path.join(current_dir, 'data', 'IR_Correlation_Table_5000_to_250.xlsx')
-
-            # Check if model and data files exist
-            if not os.path.exists(model_path):
-                logger.error(f"Model file not found at: {model_path}")
-                return Response({'error': 'Model file not found. Please check the model path.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            if not os.path.exists(reference_path):
-                logger.error(f"Reference file not found at: {reference_path}")
-                return Response({'error': 'Reference file not found. Please check the path.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-            logger.info("Model and reference files verified.")
-
-            # Peak detection and functional group matching
-            logger.info("Processing reference data for peak detection.")
-            reference_data = process_reference_data(reference_path)
-            logger.info("Reference data processed successfully.")
-
-            # Detect peaks and match
-            detected_peaks = detect_peaks_and_match(data_df, reference_data, prominence=0.005)
-            logger.info(f"Detected peaks:\n{detected_peaks}")
-
-            # Group and filter peaks
-            grouped_peaks = group_and_filter_peaks_dynamic(detected_peaks, group_by='Bond Type', sort_by='wavenumber')
-
-            if grouped_peaks.empty:
-                logger.warning("No peaks were detected or matched to the reference data.")
-                peak_report = ["No peaks were detected or matched to the reference data."]
-            else:
-                # Get the user's choice for report type (Absorbance or Transmittance)
-                report_type = request.data.get('report_type', 'absorbance').lower()
-                if report_type not in ['absorbance', 'transmittance']:
-                    report_type = 'absorbance'
-                peak_report = generate_report(grouped_peaks, report_type=report_type)
-                logger.info("Peak detection completed successfully.")
-
-            # Model prediction
-            logger.info("Running model prediction.")
-            try:
-                compound_name = predict_most_frequent_name(
-                    data_df["wavenumber"].tolist(),
-                    data_df["absorbance"].tolist(),
-                    model_path=model_path
-                )
-                logger.info(f"Model prediction completed successfully. Predicted compound name: {compound_name}")
-            except Exception as e:
-                logger.error(f"Error during compound prediction: {e}")
-                logger.debug(traceback.format_exc())
-                return Response({'error': 'Error during compound prediction.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-            # Prepare the response
-            response_data = {
-                "compound_name": compound_name,
-                "peak_report": peak_report,
-                "data": {
-                    "wavenumber": data_df["wavenumber"].tolist(),
-                    "transmittance": data_df["transmittance"].tolist(),
-                    "absorbance": data_df["absorbance"].tolist()
-                }
-            }
-
-            logger.info("File processed successfully.")
-            return Response(response_data, status=status.HTTP_200_OK)
+            for uploaded_file in uploaded_files:
+                if not uploaded_file.name.lower().endswith('.csv'):
+                    logger.warning('Invalid file format uploaded.')
+                    return Response({'error': 'Invalid file format. Please upload a CSV file.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            logger.info("Received %d file(s).", len(uploaded_files))
+
+            report_type = request.data.get('report_type', 'absorbance')
+            # Clients wanting only one of the two outputs can skip the other
+            mode = request.data.get('mode', 'both')
+
+            # Asynchronous processing: spool the uploads to disk, hand them
+            # to the Celery worker pool, and return job ids immediately so
+            # the web worker is not held for the whole pipeline.
+            if request.data.get('async', '').lower() in ('1', 'true', 'yes'):
+                from .tasks import run_spectrum_analysis
+
+                task_ids = []
+                for uploaded_file in uploaded_files:
+                    fd, spool_path = tempfile.mkstemp(suffix='.csv')
+                    with os.fdopen(fd, 'wb') as spool:
+                        for chunk in uploaded_file.chunks():
+                            spool.write(chunk)
+                    task = run_spectrum_analysis.delay(spool_path, report_type, mode)
+                    logger.info("Spectrum analysis enqueued with task id %s.", task.id)
+                    task_ids.append(task.id)
+                if len(task_ids) == 1:
+                    return Response({'task_id': task_ids[0]}, status=status.HTTP_202_ACCEPTED)
+                return Response({'task_ids': task_ids}, status=status.HTTP_202_ACCEPTED)
+
+            # Single uploads keep the original payload shape; batches get a
+            # list aligned to the order the files were sent.
+            results = [
+                analyze_spectrum(uploaded_file, report_type, mode)
+                for uploaded_file in uploaded_files
+            ]
+            if len(results) == 1:
+                return Response(results[0], status=status.HTTP_200_OK)
+            return Response(results, status=status.HTTP_200_OK)
+
+        except SpectrumProcessingError as spe:
+            return Response({'error': str(spe)}, status=spe.status_code)
 
         except ValueError as ve:
             logger.error(f"ValueError encountered: {ve}")
@@ -240,3 +460,18 @@ class DataHandlingView(generics.CreateAPIView):
                 'error': f'Internal server error. Details: {str(e)}',
                 'traceback': traceback.format_exc()
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+class AnalysisStatusView(generics.RetrieveAPIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(operation_description='Poll the state/result of an asynchronous spectrum analysis.')
+    def get(self, request, task_id, *args, **kwargs):
+        from celery.result import AsyncResult
+
+        result = AsyncResult(task_id)
+        data = {'task_id': task_id, 'state': result.state}
+        if result.successful():
+            data['result'] = result.result
+        elif result.failed():
+            data['error'] = str(result.result)
+        return Response(data, status=status.HTTP_200_OK)
@@ -51,7 +51,12 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'userleader_app.CustomUser'
 
 MIDDLEWARE = [
+    # First so health probes short-circuit the rest of the stack
+    'utils.health.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Compress responses on the wire; the spectrum arrays are tens to
+    # hundreds of KB of JSON that gzip shrinks several-fold.
+    'django.middleware.gzip.GZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.common.CommonMiddleware',
@@ -66,7 +71,10 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'userleader_app.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'userleader_app.renderers.ORJSONRenderer',
     ),
 }
 
@@ -110,6 +118,63 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
 
+# Uploads
+# Hard cap for spectrum uploads; DataHandlingView rejects anything larger
+# with a 413 before the body is parsed. Bodies above 2.5 MB (Django's
+# FILE_UPLOAD_MAX_MEMORY_SIZE default) spool to disk rather than RAM.
+MAX_UPLOAD_SIZE = 20 * 1024 * 1024
+DATA_UPLOAD_MAX_MEMORY_SIZE = MAX_UPLOAD_SIZE
+
+# Logging
+# https://docs.djangoproject.com/en/5.0/topics/logging/
+# Configured here once instead of logging.basicConfig in view modules.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
+    },
+}
+
+# Celery (asynchronous spectrum analysis)
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+# Spectrum analysis gets its own queue so long-running pipeline tasks
+# can be scaled (or starved) independently of any future default-queue work.
+CELERY_TASK_ROUTES = {
+    'userleader_app.tasks.run_spectrum_analysis': {'queue': 'spectra'},
+}
+# Run tasks inline when no broker is available (development/tests).
+CELERY_TASK_ALWAYS_EAGER = os.environ.get('CELERY_TASK_ALWAYS_EAGER', 'False') == 'True'
+
+# Logout blacklists the refresh token in-request by default; set
+# LOGOUT_SYNC=False (with a Celery worker running) to offload the DB
+# write and answer in roughly the token-decode time.
+LOGOUT_SYNC = os.environ.get('LOGOUT_SYNC', 'True') == 'True'
+
+# Keep the refresh-token deny-list in the cache framework instead of the
+# token_blacklist tables: logout becomes one cache SETEX and refresh one
+# cache read. Requires a cache shared by all workers (e.g. Redis via
+# CACHES) — the per-process default would let tokens slip through, so
+# this stays off until one is configured. When enabled, logout always
+# writes the deny-list in-request regardless of LOGOUT_SYNC: the cache
+# write is already cheap, and the async task's DB blacklist would never
+# be consulted by the cache-backed refresh path.
+TOKEN_DENYLIST_CACHE = os.environ.get('TOKEN_DENYLIST_CACHE', 'False') == 'True'
+if TOKEN_DENYLIST_CACHE:
+    SIMPLE_JWT['TOKEN_REFRESH_SERIALIZER'] = (
+        'userleader_app.serializer.CacheDenylistTokenRefreshSerializer'
+    )
+
 ROOT_URLCONF = 'userleader_backend.urls'
 
 TEMPLATES = [
@@ -157,6 +222,17 @@ DJANGO_REST_PASSWORDRESET_TOKEN_CONFIG = {
     }
 }
 
+# Password hashing
+# Argon2id first; the legacy hashers stay listed so existing PBKDF2 hashes
+# keep verifying and upgrade transparently on next successful login.
+PASSWORD_HASHERS = [
+    'utils.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
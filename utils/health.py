@@ -0,0 +1,19 @@
+from django.http import HttpResponse
+
+
+class HealthCheckMiddleware:
+    """
+    Answer load-balancer liveness probes before URL resolution.
+
+    Probes hit frequently and need nothing from the stack below; cutting
+    them off here skips the whole middleware chain, the URL resolver, and
+    session/auth work for every probe.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == '/health/':
+            return HttpResponse(b'ok', content_type='text/plain')
+        return self.get_response(request)